@@ -1,21 +1,42 @@
 import argparse
 import json
 import sys
+from functools import partial
 from dictionary_api import word_data as wd
 
 
 VERSION = "1.0.0"
-# Dictionary of available functions and their corresponding implementations
+
+
+def format_plain(result):
+	"""Returns already formatted text unchanged."""
+	return result
+
+
+def format_list(result):
+	"""Formats a list of words or sentences, one per line."""
+	return "\n".join([i.capitalize() for i in result])
+
+
+def format_definitions(result):
+	"""Formats definition entries as "Pos: definition" lines."""
+	return "\n".join([f"{i['pos'].capitalize()}: {i['definition']}" for i in result])
+
+
+format_json = partial(json.dumps, indent=4)
+
+
+# Dictionary of available functions, mapped to their implementation and output formatter
 options_mapping = {
-	"plain": wd.get_word_data_plain,
-	"data": wd.get_word_data,
-	"pos": wd.get_pos,
-	"synonyms": wd.get_synonyms,
-	"antonyms": wd.get_antonyms,
-	"definitions": wd.get_definitions,
-	"examples": wd.get_examples,
-	"hypernyms": wd.get_hypernyms,
-	"hyponyms": wd.get_hyponyms
+	"plain": (wd.get_word_data_plain, format_plain),
+	"data": (wd.get_word_data, format_json),
+	"pos": (wd.get_pos, format_list),
+	"synonyms": (wd.get_synonyms, format_list),
+	"antonyms": (wd.get_antonyms, format_list),
+	"definitions": (wd.get_definitions, format_definitions),
+	"examples": (wd.get_examples, format_list),
+	"hypernyms": (wd.get_hypernyms, format_list),
+	"hyponyms": (wd.get_hyponyms, format_list)
 }
 
 
@@ -57,18 +78,11 @@ def run_interactively():
 
 def define(option, word, as_json=False):
 	"""Retrieves the requested information about the word."""
-	result = options_mapping[option](word)
-	
+	func, formatter = options_mapping[option]
+	result = func(word)
 	if as_json:
-		return json.dumps(result, indent=4)
-	
-	if option != "plain":
-		if isinstance(result, list):
-			result = "\n".join([i.capitalize() for i in result])
-		elif isinstance(result, dict):
-			result = json.dumps(result, indent=4)
-	
-	return result
+		return format_json(result)
+	return formatter(result)
 
 
 def parse_args():
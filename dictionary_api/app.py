@@ -1,9 +1,47 @@
+import threading
+from functools import lru_cache
+
+import orjson
 from flask import Flask, jsonify, render_template, request
+from flask_compress import Compress
 
 import word_data as wd
 
 
 app = Flask(__name__)
+# Entries for polysemous words are large and repetitive, so compress responses
+# Brotli at level 4 is faster than gzip at a similar ratio; gzip covers older clients
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_BR_LEVEL"] = 4
+Compress(app)
+# Load NLTK and WordNet in the background so startup is not blocked and the first request is fast
+threading.Thread(target=wd.warm_up, daemon=True).start()
+
+
+def parse_pos_filter(pos_str):
+	"""Splits a comma-separated part of speech filter into a hashable tuple.
+	Tags and names are canonicalized by word_data, not here.
+	Returns None if no parts of speech were given."""
+	if not pos_str:
+		return None
+	# Split by comma and remove any leading/trailing whitespace
+	return tuple(p.strip() for p in pos_str.split(',') if p.strip()) or None
+
+
+def json_response(payload, status=200):
+	"""Serializes a payload with orjson, which is considerably faster than jsonify for large entries."""
+	return app.response_class(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+@lru_cache(maxsize=10000)
+def word_json(word, pos_filter=None):
+	"""Looks up and serializes word data, caching the encoded body.
+	Returns None if no definitions were found."""
+	# The word is already lemmatized, so skip get_word_data's lemmatization
+	word_data = wd.get_lemma_data(word, pos_filter)
+	if word_data and word_data.get("num_senses", 0) > 0:
+		return orjson.dumps({"data": word_data, "error": None})
+	return None
 
 
 @app.route("/api/health")
@@ -24,20 +62,18 @@ def word_lookup(word=None):
 	word = word or request.args.get("word")
 	pos_str = request.args.get("pos") # Part of speech filter (comma-separated)
 	if not word:
-		return jsonify({"data": None, "error": "Missing 'word' query parameter"}), 400
-	pos_filter = None
-	if pos_str:
-		# Split by comma and remove any leading/trailing whitespace
-		pos_filter = [p.strip() for p in pos_str.split(',')]
+		return json_response({"data": None, "error": "Missing 'word' query parameter"}, 400)
+	pos_filter = parse_pos_filter(pos_str)
 	try:
-		word_data = wd.get_word_data(word, pos_filter=pos_filter)
-		if word_data and word_data.get("num_senses", 0) > 0:
-			return jsonify({"data": word_data, "error": None}), 200
+		# Key the body cache on the lemma so case variants share one entry
+		body = word_json(wd.lemmatize_word(word), pos_filter)
+		if body is not None:
+			return app.response_class(body, status=200, mimetype="application/json")
 		else:
-			return jsonify({"data": None, "error": f"No definitions found for '{word}'"}), 404
+			return json_response({"data": None, "error": f"No definitions found for '{word}'"}, 404)
 	except Exception as e:
 		app.logger.error(f"Error processing word '{word}': {e}")
-		return jsonify({"data": None, "error": "An internal server error occurred"}), 500
+		return json_response({"data": None, "error": "An internal server error occurred"}, 500)
 
 
 @app.route("/api/word/plain")
@@ -49,10 +85,7 @@ def word_lookup_plain(word=None):
 	pos_str = request.args.get("pos") # Part of speech filter (comma-separated)
 	if not word:
 		return "Missing 'word' query parameter", 400
-	pos_filter = None
-	if pos_str:
-		# Split by comma and remove any leading/trailing whitespace
-		pos_filter = [p.strip() for p in pos_str.split(',')]
+	pos_filter = parse_pos_filter(pos_str)
 	try:
 		word_data = wd.get_word_data_plain(word, pos_filter=pos_filter)
 		print(word_data)
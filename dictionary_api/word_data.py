@@ -1,6 +1,6 @@
-from typing import List, Optional, Dict, Any, Set, Tuple
-from nltk.corpus import wordnet as wn
-from nltk.stem import WordNetLemmatizer
+import sys
+import threading
+from typing import List, Optional, Dict, Any, Set, Tuple, Iterable, Sequence
 from functools import lru_cache
 
 
@@ -12,8 +12,42 @@ POS_MAPPING = {
 	"r": "adverb",
 }
 
+# Human-readable POS -> WordNet tags, e.g. "adjective" -> {"a", "s"}
+_REVERSE_POS: Dict[str, frozenset] = {
+	name: frozenset(tag for tag, n in POS_MAPPING.items() if n == name)
+	for name in POS_MAPPING.values()
+}
+# Accepted POS filter values (tags or names) -> human-readable POS
+_POS_ALIASES = {**POS_MAPPING, **{name: name for name in _REVERSE_POS}}
+
+# NLTK is slow to import, so it is loaded on first use by _ensure_nltk()
+wn = None
+_LEMMATIZER = None
+_NLTK_LOCK = threading.Lock()
+
+
+def _ensure_nltk() -> None:
+	"""
+	Import NLTK, load the WordNet corpus and create the shared lemmatizer if needed.
+
+	Callers block until the corpus is fully loaded, so no thread can query
+	WordNet while another is still reading it from disk.
+	"""
+	global wn, _LEMMATIZER
+	if _LEMMATIZER is not None:
+		return
+	with _NLTK_LOCK:
+		if _LEMMATIZER is not None:
+			return
+		from nltk.corpus import wordnet
+		from nltk.stem import WordNetLemmatizer
+		wordnet.ensure_loaded()
+		wn = wordnet
+		# Constructed once; WordNetLemmatizer holds no per-call state.
+		# Assigned last, as it marks NLTK as ready for the unlocked check above
+		_LEMMATIZER = WordNetLemmatizer()
+
 
-@lru_cache(maxsize=5)
 def normalize_pos(tag: str) -> str:
 	"""
 	Convert WordNet POS tag to human-readable form.
@@ -27,6 +61,7 @@ def normalize_pos(tag: str) -> str:
 	return POS_MAPPING.get(tag, tag)
 
 
+@lru_cache(maxsize=20000)
 def lemmatize_word(word: str) -> str:
 	"""
 	Lemmatize a word to its base form.
@@ -35,13 +70,14 @@ def lemmatize_word(word: str) -> str:
 			word: Word to lemmatize
 
 	Returns:
-			Lemmatized word
+			Lemmatized word, interned
 	"""
-	lemmatizer = WordNetLemmatizer()
-	return lemmatizer.lemmatize(word.lower())
+	_ensure_nltk()
+	# Interned so downstream cache keys for the same lemma compare by identity
+	return sys.intern(_LEMMATIZER.lemmatize(word.lower()))
 
 
-def get_synsets(word: str, pos_filter: Optional[List[str]] = None) -> List[wn.synset]:
+def get_synsets(word: str, pos_filter: Optional[Sequence[str]] = None) -> List[Any]:
 	"""
 	Get all synsets for a word, optionally filtered by part of speech.
 
@@ -52,29 +88,33 @@ def get_synsets(word: str, pos_filter: Optional[List[str]] = None) -> List[wn.sy
 	Returns:
 			List of WordNet synsets
 	"""
+	_ensure_nltk()
 	synsets = wn.synsets(word)
 	if not pos_filter:
 		return synsets
-	# Convert human-readable POS to WordNet tags for filtering
-	# This allows parameters like ["n", "noun", "Noun"]
-	pos_filter = [pos.lower() for pos in pos_filter]
-	reverse_mapping = {v: k for k, v in POS_MAPPING.items()}
-	wn_pos_filter = [reverse_mapping.get(pos, pos) for pos in pos_filter]
-	return [synset for synset in synsets if synset.pos() in wn_pos_filter]
+	# Parameters like ["n", "noun", "Noun"] are equivalent,
+	# and "adjective" matches both "a" and "s" synsets
+	wn_tags = set()
+	for pos in _pos_key(pos_filter):
+		wn_tags.update(_REVERSE_POS.get(pos, (pos,)))
+	return [synset for synset in synsets if synset.pos() in wn_tags]
 
 
-def format_lemma_name(name: str) -> str:
+def _pos_key(pos_filter: Optional[Iterable[str]]) -> Tuple[str, ...]:
 	"""
-	Format a lemma name.
-	Simply replaces underscores with spaces for now.
+	Canonicalize a part of speech filter so it can be used as a cache key.
 
 	Args:
-			name: Lemma name from WordNet
+			pos_filter: Optional iterable of parts of speech, as WordNet tags or names
 
 	Returns:
-			Formatted name
+			Sorted tuple of unique human-readable parts of speech (empty if no filter)
 	"""
-	return name.replace("_", " ")
+	if not pos_filter:
+		return ()
+	return tuple(sorted({
+		_POS_ALIASES.get(pos, pos) for pos in (p.strip().lower() for p in pos_filter)
+	}))
 
 
 def get_pos(word: str) -> List[str]:
@@ -87,13 +127,13 @@ def get_pos(word: str) -> List[str]:
 	Returns:
 			List of parts of speech
 	"""
-	synsets = get_synsets(lemmatize_word(word))
-	pos_set = {normalize_pos(synset.pos()) for synset in synsets}
-	return sorted(list(pos_set))
+	# The per-POS index already holds each distinct part of speech once
+	_, by_pos = _get_word_senses(lemmatize_word(word))
+	return sorted(by_pos)
 
 
 def get_definitions(
-	word: str, pos_filter: Optional[List[str]] = None
+	word: str, pos_filter: Optional[Sequence[str]] = None
 ) -> List[Dict[str, Any]]:
 	"""
 	Get all definitions for a word.
@@ -105,17 +145,21 @@ def get_definitions(
 	Returns:
 			List of definitions with POS and examples
 	"""
-	lemmatized = lemmatize_word(word)
-	synsets = get_synsets(lemmatized, pos_filter)
+	entries = get_word_data(word, pos_filter)["entries"]
 	definitions = []
 	seen_definitions = set()
-	for synset in synsets:
-		definition = synset.definition()
+	for entry in entries:
+		definition = entry["definition"]
 		# Skip duplicate definitions
 		if definition in seen_definitions:
 			continue
 		seen_definitions.add(definition)
-		definitions.append(definition)
+		definitions.append({
+			"definition": definition,
+			"pos": entry["pos"],
+			# Copied so callers cannot alter the cached entry
+			"examples": list(entry["examples"]),
+		})
 	return definitions
 
 
@@ -135,7 +179,7 @@ def get_definition(word: str, pos: Optional[str] = None) -> str:
 	return definitions[0]["definition"] if definitions else ""
 
 
-def get_synonyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str]:
+def get_synonyms(word: str, pos_filter: Optional[Sequence[str]] = None) -> List[str]:
 	"""
 	Get all synonyms for a word.
 
@@ -146,19 +190,14 @@ def get_synonyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str]
 	Returns:
 			List of synonyms
 	"""
-	lemmatized = lemmatize_word(word)
-	synsets = get_synsets(lemmatized, pos_filter)
+	entries = get_word_data(word, pos_filter)["entries"]
 	synonyms = set()
-	for synset in synsets:
-		for lemma in synset.lemmas():
-			synonyms.add(format_lemma_name(lemma.name()))
-	# Remove the word itself from synonyms
-	if lemmatized in synonyms:
-		synonyms.remove(lemmatized)
-	return sorted(list(synonyms))
+	for entry in entries:
+		synonyms.update(entry["synonyms"])
+	return sorted(synonyms)
 
 
-def get_antonyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str]:
+def get_antonyms(word: str, pos_filter: Optional[Sequence[str]] = None) -> List[str]:
 	"""
 	Get all antonyms for a word.
 
@@ -169,17 +208,14 @@ def get_antonyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str]
 	Returns:
 			List of antonyms
 	"""
-	lemmatized = lemmatize_word(word)
-	synsets = get_synsets(lemmatized, pos_filter)
+	entries = get_word_data(word, pos_filter)["entries"]
 	antonyms = set()
-	for synset in synsets:
-		for lemma in synset.lemmas():
-			for antonym in lemma.antonyms():
-				antonyms.add(format_lemma_name(antonym.name()))
-	return sorted(list(antonyms))
+	for entry in entries:
+		antonyms.update(entry["antonyms"])
+	return sorted(antonyms)
 
 
-def get_examples(word: str, pos_filter: Optional[List[str]] = None) -> List[str]:
+def get_examples(word: str, pos_filter: Optional[Sequence[str]] = None) -> List[str]:
 	"""
 	Get all usage examples for a word.
 
@@ -190,18 +226,17 @@ def get_examples(word: str, pos_filter: Optional[List[str]] = None) -> List[str]
 	Returns:
 			List of example sentences
 	"""
-	lemmatized = lemmatize_word(word)
-	synsets = get_synsets(lemmatized, pos_filter)
+	entries = get_word_data(word, pos_filter)["entries"]
 
 	examples = set()
 
-	for synset in synsets:
-		examples.update(synset.examples())
+	for entry in entries:
+		examples.update(entry["examples"])
 
-	return sorted(list(examples))
+	return sorted(examples)
 
 
-def get_hypernyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str]:
+def get_hypernyms(word: str, pos_filter: Optional[Sequence[str]] = None) -> List[str]:
 	"""
 	Get all hypernyms (more general terms) for a word.
 
@@ -212,20 +247,17 @@ def get_hypernyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str
 	Returns:
 			List of hypernyms
 	"""
-	lemmatized = lemmatize_word(word)
-	synsets = get_synsets(lemmatized, pos_filter)
+	entries = get_word_data(word, pos_filter)["entries"]
 
 	hypernyms = set()
 
-	for synset in synsets:
-		for hypernym in synset.hypernyms():
-			for lemma in hypernym.lemmas():
-				hypernyms.add(format_lemma_name(lemma.name()))
+	for entry in entries:
+		hypernyms.update(entry["hypernyms"])
 
-	return sorted(list(hypernyms))
+	return sorted(hypernyms)
 
 
-def get_hyponyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str]:
+def get_hyponyms(word: str, pos_filter: Optional[Sequence[str]] = None) -> List[str]:
 	"""
 	Get all hyponyms (more specific terms) for a word.
 
@@ -236,84 +268,81 @@ def get_hyponyms(word: str, pos_filter: Optional[List[str]] = None) -> List[str]
 	Returns:
 			List of hyponyms
 	"""
-	lemmatized = lemmatize_word(word)
-	synsets = get_synsets(lemmatized, pos_filter)
+	entries = get_word_data(word, pos_filter)["entries"]
 
 	hyponyms = set()
 
-	for synset in synsets:
-		for hyponym in synset.hyponyms():
-			for lemma in hyponym.lemmas():
-				hyponyms.add(format_lemma_name(lemma.name()))
+	for entry in entries:
+		hyponyms.update(entry["hyponyms"])
 
-	return sorted(list(hyponyms))
+	return sorted(hyponyms)
 
 
-@lru_cache(maxsize=100)
-def get_word_data(word: str, pos_filter: Optional[List[str]] = None) -> Dict[str, Any]:
+@lru_cache(maxsize=50000)
+def _get_word_senses(word: str) -> Tuple[List[Dict[str, Any]], Dict[str, List[int]]]:
 	"""
-	Get comprehensive data about a word including definitions, examples, synonyms and antonyms.
+	Build the unfiltered per-sense entries for a lemmatized word.
 
 	Args:
-			word: Word to lookup
-			pos_filter: Optional list of parts of speech to filter by
+			word: Lemmatized word to lookup
 
 	Returns:
-			Dictionary containing word data organized by sense
+			Tuple of the entries and a mapping of human-readable POS to entry indices
 	"""
-	lemmatized = lemmatize_word(word)
-	synsets = get_synsets(lemmatized, pos_filter)
+	synsets = get_synsets(word)
 	entries = []
+	by_pos = {}
 
 	for synset in synsets:
-		pos = normalize_pos(synset.pos())
+		tag = synset.pos()
+		pos = POS_MAPPING.get(tag, tag)
 
 		# Get synonyms and antonyms for this specific synset
 		synonyms = set()
 		antonyms = set()
 
+		# Lemma names use underscores in place of spaces ("well_chosen")
 		for lemma in synset.lemmas():
-			lemma_name = format_lemma_name(lemma.name())
+			lemma_name = lemma.name().replace("_", " ")
 			synonyms.add(lemma_name)
 
 			for antonym in lemma.antonyms():
-				antonyms.add(format_lemma_name(antonym.name()))
+				antonyms.add(antonym.name().replace("_", " "))
 
 		# Remove the word itself from synonyms
-		if lemmatized in synonyms:
-			synonyms.remove(lemmatized)
+		synonyms.discard(word)
 
 		# Get hypernyms and hyponyms for this synset
 		hypernyms = {
-			format_lemma_name(lemma.name())
+			lemma.name().replace("_", " ")
 			for hypernym in synset.hypernyms()
 			for lemma in hypernym.lemmas()
 		}
 
 		hyponyms = {
-			format_lemma_name(lemma.name())
+			lemma.name().replace("_", " ")
 			for hyponym in synset.hyponyms()
 			for lemma in hyponym.lemmas()
 		}
 
 		entry = {
-			"word": lemmatized,
+			"word": word,
 			"definition": synset.definition(),
 			"pos": pos,
 			"examples": synset.examples(),
-			"synonyms": sorted(list(synonyms)),
-			"antonyms": sorted(list(antonyms)),
-			"hypernyms": sorted(list(hypernyms)),
-			"hyponyms": sorted(list(hyponyms)),
+			"synonyms": sorted(synonyms),
+			"antonyms": sorted(antonyms),
+			"hypernyms": sorted(hypernyms),
+			"hyponyms": sorted(hyponyms),
 			"synset_id": synset.name(),
 		}
+		by_pos.setdefault(pos, []).append(len(entries))
 		entries.append(entry)
 
-	return {"word": lemmatized, "entries": entries, "num_senses": len(entries)}
+	return entries, by_pos
 
 
-@lru_cache(maxsize=100)
-def get_word_data_plain(word: str, pos_filter: Optional[List[str]] = None) -> Dict[str, Any]:
+def get_word_data(word: str, pos_filter: Optional[Sequence[str]] = None) -> Dict[str, Any]:
 	"""
 	Get comprehensive data about a word including definitions, examples, synonyms and antonyms.
 
@@ -321,22 +350,101 @@ def get_word_data_plain(word: str, pos_filter: Optional[List[str]] = None) -> Di
 			word: Word to lookup
 			pos_filter: Optional list of parts of speech to filter by
 
+	Returns:
+			Dictionary containing word data organized by sense
+	"""
+	return _word_data_for_lemma(lemmatize_word(word), _pos_key(pos_filter))
+
+
+def get_lemma_data(lemma: str, pos_filter: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+	"""
+	Get word data for a word that is already lemmatized.
+
+	Use this instead of get_word_data when holding the output of lemmatize_word,
+	since lemmatizing a lemma again is not always a no-op ("pass" -> "pa").
+
+	Args:
+			lemma: Lemmatized word to lookup
+			pos_filter: Optional list of parts of speech to filter by
+
+	Returns:
+			Dictionary containing word data organized by sense
+	"""
+	return _word_data_for_lemma(lemma, _pos_key(pos_filter))
+
+
+def _word_data_for_lemma(word: str, pos_key: Tuple[str, ...] = ()) -> Dict[str, Any]:
+	"""
+	Get word data for an already lemmatized word.
+
+	Callers outside this module should use get_lemma_data, which
+	canonicalizes the filter.
+
+	Args:
+			word: Lemmatized word to lookup
+			pos_key: Canonical filter as returned by _pos_key()
+
+	Returns:
+			Dictionary containing word data organized by sense
+	"""
+	# Every POS filter is served from the one cached, unfiltered lookup
+	entries, by_pos = _get_word_senses(word)
+	if pos_key:
+		indices = sorted(i for pos in pos_key for i in by_pos.get(pos, ()))
+		entries = [entries[i] for i in indices]
+	return {"word": word, "entries": entries, "num_senses": len(entries)}
+
+
+def get_word_data_plain(word: str, pos_filter: Optional[Sequence[str]] = None) -> str:
+	"""
+	Get comprehensive data about a word including definitions, examples, synonyms and antonyms.
+
+	Args:
+			word: Word to lookup
+			pos_filter: Optional list of parts of speech to filter by
+
+	Returns:
+			String containing the pretty printed word data organized by sense
+	"""
+	return _plain_for_lemma(lemmatize_word(word), _pos_key(pos_filter))
+
+
+@lru_cache(maxsize=10000)
+def _plain_for_lemma(word: str, pos_key: Tuple[str, ...] = ()) -> str:
+	"""
+	Pretty print the data for an already lemmatized word, cached by lemma and filter.
+
+	Args:
+			word: Lemmatized word to lookup
+			pos_key: Canonical filter as returned by _pos_key()
+
 	Returns:
 			String containing the pretty printed word data organized by sense
 	"""
-	wd = get_word_data(word=word, pos_filter=pos_filter)
+	wd = _word_data_for_lemma(word, pos_key)
 	output = []
 	for i, entry in enumerate(wd["entries"]):
-		final = f"{i+1}. {entry['pos'].capitalize()}: {entry['definition']}\n"
-		if len(entry["examples"]) > 0:
-			final += "Examples:" + "\t" + ("\n\t".join(entry["examples"])) + "\n"
-		if len(entry["synonyms"]) > 0:
-			final += "Synonyms: " + ", ".join(entry["synonyms"]) + "\n"
-		if len(entry["antonyms"]) > 0:
-			final += "Antonyms: " + ", ".join(entry["antonyms"]) + "\n"
-		if len(entry["hypernyms"]) > 0:
-			final += "Hypernyms: " + ", ".join(entry["hypernyms"]) + "\n"
-		if len(entry["hyponyms"]) > 0:
-			final += "Hyponyms: " + ", ".join(entry["hyponyms"]) + "\n"
-		output.append(final)
-	return "\n".join(output)
+		parts = [f"{i+1}. {entry['pos'].capitalize()}: {entry['definition']}\n"]
+		if entry["examples"]:
+			parts += ["Examples:\t", "\n\t".join(entry["examples"]), "\n"]
+		if entry["synonyms"]:
+			parts += ["Synonyms: ", ", ".join(entry["synonyms"]), "\n"]
+		if entry["antonyms"]:
+			parts += ["Antonyms: ", ", ".join(entry["antonyms"]), "\n"]
+		if entry["hypernyms"]:
+			parts += ["Hypernyms: ", ", ".join(entry["hypernyms"]), "\n"]
+		if entry["hyponyms"]:
+			parts += ["Hyponyms: ", ", ".join(entry["hyponyms"]), "\n"]
+		output.append(parts)
+	return "\n".join("".join(parts) for parts in output)
+
+
+def warm_up() -> None:
+	"""
+	Load the WordNet corpus and lemmatizer ahead of the first lookup.
+
+	NLTK and WordNet are loaded lazily, so without this the first request pays
+	the cost of importing NLTK and reading the corpus from disk.
+	"""
+	_ensure_nltk()
+	_LEMMATIZER.lemmatize("warm", "n")